@@ -59,6 +59,10 @@ def get_db() -> Session:
     with Session(engine) as session:
         yield session
 
+def get_now() -> datetime:
+    """現在時刻取得（テストでは dependency_overrides で固定可能）"""
+    return datetime.now(timezone.utc)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """アプリケーションライフサイクル管理"""
@@ -290,7 +294,8 @@ async def login_user(login_data: UserLogin, db: Session = Depends(get_db)):
 async def update_user_profile(
     profile_data: UserProfileUpdate, 
     db: Session = Depends(get_db),
-    authorization: str = Header(None)
+    authorization: str = Header(None),
+    now: datetime = Depends(get_now)
 ):
     """ユーザープロフィール更新"""
     try:
@@ -309,7 +314,7 @@ async def update_user_profile(
             "language": "en-US",
             "country": "US",
             "timezone": "UTC",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now.isoformat()
         }
         
         # プロフィール情報を更新
@@ -318,7 +323,7 @@ async def update_user_profile(
             if value is not None:
                 updated_user[field] = value
         
-        updated_user["updated_at"] = datetime.now(timezone.utc).isoformat()
+        updated_user["updated_at"] = now.isoformat()
         
         return {
             "message": "Profile updated successfully",
@@ -3,8 +3,13 @@ Pytest configuration and fixtures for the test suite.
 """
 
 import pytest
+from datetime import datetime, timezone
 from fastapi.testclient import TestClient
-from app_simple import app, posts_storage, post_id_counter
+from app_simple import app, posts_storage, post_id_counter, HealthCheck, PostCreate, PostRead
+from app_auth_simple import app as auth_app, get_now
+
+
+_FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
 
 
 @pytest.fixture
@@ -13,6 +18,50 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture(scope="session")
+def auth_client():
+    """Create a test client for the auth FastAPI app, shared by the session."""
+    return TestClient(auth_app)
+
+
+@pytest.fixture(scope="module")
+def frozen_now():
+    """Freeze the auth app's clock for a module and return the frozen time."""
+    auth_app.dependency_overrides[get_now] = lambda: _FROZEN_NOW
+    yield _FROZEN_NOW
+    auth_app.dependency_overrides.pop(get_now, None)
+
+
+@pytest.fixture(scope="session")
+def registered_token(auth_client):
+    """Register one auth user for the session and return its access token."""
+    response = auth_client.post("/auth/register", json={
+        "email": "session-user@example.com",
+        "password": "password123",
+        "nickname": "SessionUser",
+        "first_name": "Session",
+        "last_name": "User",
+        "primary_condition": "Test Condition",
+        "language": "en-US",
+        "country": "US",
+        "timezone": "UTC"
+    })
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
+@pytest.fixture(scope="session")
+def login_token(auth_client, registered_token):
+    """Log the session auth user in once and return the login access token."""
+    response = auth_client.post("/auth/login", json={
+        "email": "session-user@example.com",
+        "password": "password123",
+        "remember_me": False
+    })
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
 @pytest.fixture
 def clean_posts_storage():
     """Clean posts storage before each test."""
@@ -47,6 +96,30 @@ def multiple_posts_data():
     ]
 
 
+@pytest.fixture(scope="session")
+def sample_health_check():
+    """Shared HealthCheck instance for read-only model tests."""
+    return HealthCheck(status="ok", message="test")
+
+
+@pytest.fixture(scope="session")
+def sample_post_create():
+    """Shared PostCreate instance for read-only model tests."""
+    return PostCreate(title="Test", content="Content", group_id=1)
+
+
+@pytest.fixture(scope="session")
+def sample_post_read():
+    """Shared PostRead instance for read-only model tests."""
+    return PostRead(
+        id=1,
+        title="Test",
+        content="Content",
+        group_id=1,
+        created_at="2024-01-01T00:00:00Z"
+    )
+
+
 @pytest.fixture
 def created_post(client, sample_post_data):
     """Create a post and return its data."""
@@ -84,6 +157,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "model: Model validation tests"
     )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): Pin tests to the same pytest-xdist worker"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
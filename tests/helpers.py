@@ -0,0 +1,54 @@
+"""
+Shared helpers for the test suite.
+"""
+
+import json
+import re
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 英語の可能性が高い単語（日本語ファイルへの英語混入チェック用）
+EN_WORDS_RE = re.compile(r"(?i)\b(?:the|and|or|for|with|to|in|on|at)\b")
+
+# Long field values shared by the large-payload profile tests
+A1K = "A" * 1000
+B1K = "B" * 1000
+C1K = "C" * 1000
+D1K = "D" * 1000
+
+
+def dumps(data):
+    """Serialize to compact JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data):
+    """Parse JSON text or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path):
+    """Read and parse a JSON file."""
+    return loads(Path(path).read_bytes())
+
+
+def iter_translation_items(translations):
+    """ネストした翻訳辞書を (ドット区切りキー, 値) の組として反復的に走査する"""
+    stack = [((), translations)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            path = prefix + (key,)
+            if isinstance(value, dict):
+                stack.append((path, value))
+            else:
+                yield ".".join(path), value
@@ -4,8 +4,46 @@ Tests the profile page components and user interactions.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
 import json
+import re
+from typing import NamedTuple
+
+
+pytestmark = pytest.mark.xdist_group(name="frontend_profile")
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_SHORT_NICKNAME = "A"
+_LONG_NICKNAME = "A" * 1000
+
+_REQUIRED_PROFILE_FIELDS = ("email", "nickname", "first_name", "last_name")
+
+
+def _is_valid_profile_form(form):
+    """Return True when every required field is filled and the email is well-formed."""
+    for name in _REQUIRED_PROFILE_FIELDS:
+        value = form.get(name)
+        if not isinstance(value, str) or not value:
+            return False
+    return _EMAIL_RE.match(form["email"]) is not None
+
+
+class FormField(NamedTuple):
+    """Accessible profile form field."""
+    name: str
+    label: str
+    type: str
+
+
+_FORM_FIELDS = (
+    FormField("email", "メールアドレス", "email"),
+    FormField("nickname", "ニックネーム", "text"),
+    FormField("first_name", "名", "text"),
+    FormField("last_name", "姓", "text"),
+    FormField("primary_condition", "主な疾患", "text"),
+    FormField("language", "言語", "select"),
+    FormField("country", "国", "select"),
+    FormField("timezone", "タイムゾーン", "select"),
+)
 
 
 class TestProfilePageComponents:
@@ -27,17 +65,13 @@ class TestProfilePageComponents:
             "created_at": "2024-01-01T00:00:00Z"
         }
         
-        with patch('builtins.open', create=True) as mock_open:
-            with patch('json.load') as mock_json_load:
-                mock_json_load.return_value = mock_user_data
-                
-                # This would be the actual component test in a real React testing environment
-                # For now, we'll test the data structure
-                assert mock_user_data["id"] == 1
-                assert mock_user_data["email"] == "test@example.com"
-                assert mock_user_data["nickname"] == "TestUser"
-                assert mock_user_data["language"] == "ja-JP"
-                assert mock_user_data["country"] == "JP"
+        # This would be the actual component test in a real React testing environment
+        # For now, we'll test the data structure
+        assert mock_user_data["id"] == 1
+        assert mock_user_data["email"] == "test@example.com"
+        assert mock_user_data["nickname"] == "TestUser"
+        assert mock_user_data["language"] == "ja-JP"
+        assert mock_user_data["country"] == "JP"
 
     def test_profile_form_validation(self):
         """Test profile form validation logic."""
@@ -54,11 +88,7 @@ class TestProfilePageComponents:
         }
         
         # All required fields present
-        required_fields = ["email", "nickname", "first_name", "last_name"]
-        for field in required_fields:
-            assert field in valid_form_data
-            assert valid_form_data[field] is not None
-            assert valid_form_data[field] != ""
+        assert _is_valid_profile_form(valid_form_data)
 
     def test_profile_form_validation_empty_fields(self):
         """Test profile form validation with empty fields."""
@@ -73,11 +103,10 @@ class TestProfilePageComponents:
             "timezone": "Asia/Tokyo"
         }
         
-        # Check for empty required fields
-        required_fields = ["email", "nickname", "first_name", "last_name"]
-        for field in required_fields:
-            assert invalid_form_data[field] == ""
-            # In a real implementation, this would trigger validation errors
+        # Empty required fields must fail validation
+        assert not _is_valid_profile_form(invalid_form_data)
+        for name in _REQUIRED_PROFILE_FIELDS:
+            assert not _is_valid_profile_form({**invalid_form_data, name: "x"})
 
     def test_profile_form_validation_special_characters(self):
         """Test profile form validation with special characters."""
@@ -103,7 +132,6 @@ class TestProfilePageComponents:
         language_options = ["ja-JP", "en-US", "fr-FR"]
         
         for lang in language_options:
-            assert lang in language_options
             # Each language should be valid
             assert isinstance(lang, str)
             assert len(lang) > 0
@@ -113,7 +141,6 @@ class TestProfilePageComponents:
         country_options = ["JP", "US", "FR"]
         
         for country in country_options:
-            assert country in country_options
             # Each country should be valid
             assert isinstance(country, str)
             assert len(country) == 2  # ISO country codes are 2 characters
@@ -123,7 +150,6 @@ class TestProfilePageComponents:
         timezone_options = ["Asia/Tokyo", "America/New_York", "Europe/Paris"]
         
         for tz in timezone_options:
-            assert tz in timezone_options
             # Each timezone should be valid
             assert isinstance(tz, str)
             assert len(tz) > 0
@@ -177,7 +203,8 @@ class TestProfilePageComponents:
         }
         
         # Simulate partial update
-        updated_data = {**original_data, **update_data}
+        updated_data = original_data.copy()
+        updated_data.update(update_data)
         
         assert updated_data["nickname"] == "UpdatedNickname"
         assert updated_data["language"] == "ja-JP"
@@ -191,20 +218,25 @@ class TestProfilePageComponents:
     def test_profile_form_validation_rules(self):
         """Test profile form validation rules."""
         # Test nickname length
-        short_nickname = "A"
-        long_nickname = "A" * 1000
-        
-        # In a real implementation, these would trigger validation
-        assert len(short_nickname) == 1
-        assert len(long_nickname) == 1000
+        assert len(_SHORT_NICKNAME) == 1
+        assert len(_LONG_NICKNAME) == 1000
         
         # Test email format (basic check)
         valid_email = "test@example.com"
         invalid_email = "invalid-email"
         
-        assert "@" in valid_email
-        assert "." in valid_email
-        assert "@" not in invalid_email
+        assert _EMAIL_RE.match(valid_email) is not None
+        assert _EMAIL_RE.match(invalid_email) is None
+        
+        # Malformed emails are rejected
+        base_form = {
+            "email": valid_email,
+            "nickname": "TestUser",
+            "first_name": "Test",
+            "last_name": "User",
+        }
+        assert _is_valid_profile_form(base_form)
+        assert not _is_valid_profile_form({**base_form, "email": invalid_email})
 
     def test_profile_form_state_management(self):
         """Test profile form state management."""
@@ -225,17 +257,20 @@ class TestProfilePageComponents:
         }
         
         # Test editing state
-        editing_state = {**initial_state, "isEditing": True}
+        editing_state = initial_state.copy()
+        editing_state["isEditing"] = True
         assert editing_state["isEditing"] is True
         assert editing_state["saving"] is False
         
         # Test saving state
-        saving_state = {**editing_state, "saving": True}
+        saving_state = editing_state.copy()
+        saving_state["saving"] = True
         assert saving_state["saving"] is True
         assert saving_state["isEditing"] is True
         
         # Test success message
-        success_state = {**saving_state, "saving": False, "message": "プロフィールが更新されました"}
+        success_state = saving_state.copy()
+        success_state.update(saving=False, message="プロフィールが更新されました")
         assert success_state["saving"] is False
         assert success_state["message"] == "プロフィールが更新されました"
 
@@ -331,11 +366,13 @@ class TestProfilePageComponents:
         }
         
         # Start editing
-        editing_state = {**initial_state, "isEditing": True}
+        editing_state = initial_state.copy()
+        editing_state["isEditing"] = True
         assert editing_state["isEditing"] is True
         
         # Start saving
-        saving_state = {**editing_state, "saving": True}
+        saving_state = editing_state.copy()
+        saving_state["saving"] = True
         assert saving_state["saving"] is True
         
         # Success
@@ -372,29 +409,15 @@ class TestProfilePageComponents:
         for key, message in validation_messages.items():
             assert isinstance(message, str)
             assert len(message) > 0
-            assert message != ""
 
     def test_profile_form_accessibility(self):
         """Test profile form accessibility features."""
         # Form should have proper labels
-        form_fields = [
-            {"name": "email", "label": "メールアドレス", "type": "email"},
-            {"name": "nickname", "label": "ニックネーム", "type": "text"},
-            {"name": "first_name", "label": "名", "type": "text"},
-            {"name": "last_name", "label": "姓", "type": "text"},
-            {"name": "primary_condition", "label": "主な疾患", "type": "text"},
-            {"name": "language", "label": "言語", "type": "select"},
-            {"name": "country", "label": "国", "type": "select"},
-            {"name": "timezone", "label": "タイムゾーン", "type": "select"}
-        ]
-        
-        for field in form_fields:
-            assert "name" in field
-            assert "label" in field
-            assert "type" in field
-            assert isinstance(field["name"], str)
-            assert isinstance(field["label"], str)
-            assert isinstance(field["type"], str)
+        for field in _FORM_FIELDS:
+            assert field.name and field.label and field.type
+            assert isinstance(field.name, str)
+            assert isinstance(field.label, str)
+            assert isinstance(field.type, str)
 
     def test_profile_form_responsive_design(self):
         """Test profile form responsive design considerations."""
@@ -403,7 +426,6 @@ class TestProfilePageComponents:
         
         for size in screen_sizes:
             # In a real implementation, this would test CSS classes and layout
-            assert size in screen_sizes
             assert isinstance(size, str)
             assert len(size) > 0
 
@@ -444,10 +466,8 @@ class TestProfilePageComponents:
         }
         
         for lang_code, translations in languages.items():
-            assert isinstance(lang_code, str)
             assert isinstance(translations, dict)
             
             for key, translation in translations.items():
-                assert isinstance(key, str)
                 assert isinstance(translation, str)
                 assert len(translation) > 0
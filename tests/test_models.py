@@ -3,26 +3,42 @@ Unit tests for Pydantic models and data validation.
 """
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from app_simple import HealthCheck, PostCreate, PostRead
+from tests.helpers import dumps, loads
+
+
+# Shared constructor kwargs for tests that vary a single field
+_POST_CREATE_KW = {"title": "Test", "content": "Content"}
+_POST_READ_KW = {**_POST_CREATE_KW, "group_id": 1, "created_at": "2024-01-01T00:00:00Z"}
+_LONG_MESSAGE = "x" * 1000
+
+
+# Validators built once at import and reused by the JSON validation tests
+_HEALTH_CHECK_ADAPTER = TypeAdapter(HealthCheck)
+_POST_CREATE_ADAPTER = TypeAdapter(PostCreate)
+_POST_READ_ADAPTER = TypeAdapter(PostRead)
+
+
+def _trusted_restore(cls, json_str):
+    """Rebuild a model from JSON we just produced, skipping re-validation."""
+    data = loads(json_str)
+    return cls.model_construct(**data)
 
 
 class TestHealthCheckModel:
     """Test HealthCheck model validation."""
     
-    def test_valid_health_check(self):
+    def test_valid_health_check(self, sample_health_check):
         """Test valid HealthCheck creation."""
-        health = HealthCheck(status="ok", message="test message")
-        assert health.status == "ok"
-        assert health.message == "test message"
+        assert sample_health_check.status == "ok"
+        assert sample_health_check.message == "test"
     
-    def test_health_check_with_different_statuses(self):
+    @pytest.mark.parametrize("status", ["ok", "healthy", "error", "warning", "info"])
+    def test_health_check_with_different_statuses(self, status):
         """Test HealthCheck with different status values."""
-        statuses = ["ok", "healthy", "error", "warning", "info"]
-        
-        for status in statuses:
-            health = HealthCheck(status=status, message="test")
-            assert health.status == status
+        health = HealthCheck(status=status, message="test")
+        assert health.status == status
     
     def test_health_check_with_empty_message(self):
         """Test HealthCheck with empty message."""
@@ -32,37 +48,36 @@ class TestHealthCheckModel:
     
     def test_health_check_with_long_message(self):
         """Test HealthCheck with long message."""
-        long_message = "x" * 1000
-        health = HealthCheck(status="ok", message=long_message)
-        assert health.message == long_message
+        health = HealthCheck(status="ok", message=_LONG_MESSAGE)
+        assert health.message == _LONG_MESSAGE
     
-    def test_health_check_serialization(self):
+    def test_health_check_serialization(self, sample_health_check):
         """Test HealthCheck serialization to dict."""
-        health = HealthCheck(status="ok", message="test")
-        data = health.model_dump()
+        data = sample_health_check.model_dump()
         
         assert data["status"] == "ok"
         assert data["message"] == "test"
         assert len(data) == 2  # Only status and message fields
     
-    def test_health_check_json_serialization(self):
+    def test_health_check_json_serialization(self, sample_health_check):
         """Test HealthCheck JSON serialization."""
-        health = HealthCheck(status="ok", message="test")
-        json_data = health.model_dump_json()
+        json_data = dumps(sample_health_check.model_dump())
         
         assert '"status":"ok"' in json_data
         assert '"message":"test"' in json_data
+        
+        # The model's own serializer produces the same compact JSON
+        assert sample_health_check.model_dump_json() == json_data
 
 
 class TestPostCreateModel:
     """Test PostCreate model validation."""
     
-    def test_valid_post_create(self):
+    def test_valid_post_create(self, sample_post_create):
         """Test valid PostCreate creation."""
-        post = PostCreate(title="Test Title", content="Test Content", group_id=1)
-        assert post.title == "Test Title"
-        assert post.content == "Test Content"
-        assert post.group_id == 1
+        assert sample_post_create.title == "Test"
+        assert sample_post_create.content == "Content"
+        assert sample_post_create.group_id == 1
     
     def test_post_create_with_empty_strings(self):
         """Test PostCreate with empty strings."""
@@ -87,24 +102,22 @@ class TestPostCreateModel:
         assert post.title == title
         assert post.content == content
     
-    def test_post_create_with_different_group_ids(self):
+    @pytest.mark.parametrize("group_id", [0, 1, 100, -1, 999999])
+    def test_post_create_with_different_group_ids(self, group_id):
         """Test PostCreate with different group ID values."""
-        group_ids = [0, 1, 100, -1, 999999]
-        
-        for group_id in group_ids:
-            post = PostCreate(title="Test", content="Content", group_id=group_id)
-            assert post.group_id == group_id
+        post = PostCreate(group_id=group_id, **_POST_CREATE_KW)
+        assert post.group_id == group_id
     
-    def test_post_create_serialization(self):
+    def test_post_create_serialization(self, sample_post_create):
         """Test PostCreate serialization."""
-        post = PostCreate(title="Test", content="Content", group_id=1)
-        data = post.model_dump()
+        data = sample_post_create.model_dump()
         
         assert data["title"] == "Test"
         assert data["content"] == "Content"
         assert data["group_id"] == 1
         assert len(data) == 3
     
+    @pytest.mark.slow
     def test_post_create_validation_errors(self):
         """Test PostCreate validation errors."""
         # Missing required fields
@@ -134,64 +147,40 @@ class TestPostCreateModel:
 class TestPostReadModel:
     """Test PostRead model validation."""
     
-    def test_valid_post_read(self):
+    def test_valid_post_read(self, sample_post_read):
         """Test valid PostRead creation."""
-        post = PostRead(
-            id=1,
-            title="Test Title",
-            content="Test Content",
-            group_id=1,
-            created_at="2024-01-01T00:00:00Z"
-        )
-        assert post.id == 1
-        assert post.title == "Test Title"
-        assert post.content == "Test Content"
-        assert post.group_id == 1
-        assert post.created_at == "2024-01-01T00:00:00Z"
+        assert sample_post_read.id == 1
+        assert sample_post_read.title == "Test"
+        assert sample_post_read.content == "Content"
+        assert sample_post_read.group_id == 1
+        assert sample_post_read.created_at == "2024-01-01T00:00:00Z"
     
-    def test_post_read_with_different_ids(self):
+    @pytest.mark.parametrize("post_id", [0, 1, 100, 999999])
+    def test_post_read_with_different_ids(self, post_id):
         """Test PostRead with different ID values."""
-        ids = [0, 1, 100, 999999]
-        
-        for post_id in ids:
-            post = PostRead(
-                id=post_id,
-                title="Test",
-                content="Content",
-                group_id=1,
-                created_at="2024-01-01T00:00:00Z"
-            )
-            assert post.id == post_id
+        post = PostRead(id=post_id, **_POST_READ_KW)
+        assert post.id == post_id
     
-    def test_post_read_with_different_created_at_formats(self):
+    @pytest.mark.parametrize("timestamp", [
+        "2024-01-01T00:00:00Z",
+        "2024-12-31T23:59:59Z",
+        "2023-06-15T12:30:45Z",
+        "2025-01-01T00:00:00.000Z"
+    ])
+    def test_post_read_with_different_created_at_formats(self, timestamp):
         """Test PostRead with different created_at formats."""
-        timestamps = [
-            "2024-01-01T00:00:00Z",
-            "2024-12-31T23:59:59Z",
-            "2023-06-15T12:30:45Z",
-            "2025-01-01T00:00:00.000Z"
-        ]
-        
-        for timestamp in timestamps:
-            post = PostRead(
-                id=1,
-                title="Test",
-                content="Content",
-                group_id=1,
-                created_at=timestamp
-            )
-            assert post.created_at == timestamp
-    
-    def test_post_read_serialization(self):
-        """Test PostRead serialization."""
         post = PostRead(
             id=1,
             title="Test",
             content="Content",
             group_id=1,
-            created_at="2024-01-01T00:00:00Z"
+            created_at=timestamp
         )
-        data = post.model_dump()
+        assert post.created_at == timestamp
+    
+    def test_post_read_serialization(self, sample_post_read):
+        """Test PostRead serialization."""
+        data = sample_post_read.model_dump()
         
         assert data["id"] == 1
         assert data["title"] == "Test"
@@ -200,6 +189,7 @@ class TestPostReadModel:
         assert data["created_at"] == "2024-01-01T00:00:00Z"
         assert len(data) == 5
     
+    @pytest.mark.slow
     def test_post_read_validation_errors(self):
         """Test PostRead validation errors."""
         # Missing required fields
@@ -226,9 +216,9 @@ class TestPostReadModel:
 class TestModelIntegration:
     """Test model integration and conversion."""
     
-    def test_post_create_to_post_read_conversion(self):
+    def test_post_create_to_post_read_conversion(self, sample_post_create):
         """Test converting PostCreate to PostRead."""
-        post_create = PostCreate(title="Test", content="Content", group_id=1)
+        post_create = sample_post_create
         
         # Simulate the conversion that happens in the API
         post_read = PostRead(
@@ -243,38 +233,44 @@ class TestModelIntegration:
         assert post_read.content == post_create.content
         assert post_read.group_id == post_create.group_id
     
-    def test_model_json_roundtrip(self):
+    def test_model_json_roundtrip(self, sample_health_check, sample_post_create, sample_post_read):
         """Test JSON serialization and deserialization."""
         # HealthCheck roundtrip
-        health = HealthCheck(status="ok", message="test")
+        health = sample_health_check
         json_str = health.model_dump_json()
-        health_restored = HealthCheck.model_validate_json(json_str)
+        health_restored = _trusted_restore(HealthCheck, json_str)
         assert health_restored.status == health.status
         assert health_restored.message == health.message
         
         # PostCreate roundtrip
-        post_create = PostCreate(title="Test", content="Content", group_id=1)
+        post_create = sample_post_create
         json_str = post_create.model_dump_json()
-        post_restored = PostCreate.model_validate_json(json_str)
+        post_restored = _trusted_restore(PostCreate, json_str)
         assert post_restored.title == post_create.title
         assert post_restored.content == post_create.content
         assert post_restored.group_id == post_create.group_id
         
         # PostRead roundtrip
-        post_read = PostRead(
-            id=1,
-            title="Test",
-            content="Content",
-            group_id=1,
-            created_at="2024-01-01T00:00:00Z"
-        )
+        post_read = sample_post_read
         json_str = post_read.model_dump_json()
-        post_restored = PostRead.model_validate_json(json_str)
+        post_restored = _trusted_restore(PostRead, json_str)
         assert post_restored.id == post_read.id
         assert post_restored.title == post_read.title
         assert post_restored.content == post_read.content
         assert post_restored.group_id == post_read.group_id
         assert post_restored.created_at == post_read.created_at
+    
+    def test_model_validate_json(self, sample_health_check, sample_post_create, sample_post_read):
+        """Test JSON deserialization goes through validation."""
+        for adapter, model in (
+            (_HEALTH_CHECK_ADAPTER, sample_health_check),
+            (_POST_CREATE_ADAPTER, sample_post_create),
+            (_POST_READ_ADAPTER, sample_post_read),
+        ):
+            assert adapter.validate_json(model.model_dump_json()) == model
+        
+        with pytest.raises(ValidationError):
+            _POST_READ_ADAPTER.validate_json('{"id": "abc", "title": "Test"}')
 
 
 if __name__ == "__main__":
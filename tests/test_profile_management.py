@@ -4,609 +4,336 @@ Tests the profile update API endpoints and related functionality.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
-from datetime import datetime, timezone
-import json
+from datetime import datetime
 
+from tests.helpers import A1K, B1K, C1K, D1K, loads
 
-class TestProfileManagement:
-    """Test class for profile management functionality."""
+
+pytestmark = pytest.mark.usefixtures("frozen_now")
+
+_AUTH_HEADERS = {"Authorization": "Bearer test-token"}
+_JSON_AUTH_HEADERS = {**_AUTH_HEADERS, "Content-Type": "application/json"}
+
+# Expected fields and types of the user object in profile responses
+_USER_SCHEMA = (
+    ("id", int),
+    ("email", str),
+    ("nickname", str),
+    ("first_name", str),
+    ("last_name", str),
+    ("primary_condition", str),
+    ("language", str),
+    ("country", str),
+    ("timezone", str),
+    ("created_at", str),
+    ("updated_at", str),
+)
+
+# Request bodies shared by the profile update tests
+_SAMPLE_PROFILE_UPDATE = {
+    "nickname": "UpdatedNickname",
+    "first_name": "UpdatedFirst",
+    "last_name": "UpdatedLast",
+    "primary_condition": "Updated Condition",
+    "language": "en-US",
+    "country": "US",
+    "timezone": "America/New_York"
+}
+_PARTIAL_PROFILE_UPDATE = {
+    "nickname": "PartialUpdate",
+    "language": "fr-FR"
+}
+_LARGE_PROFILE_UPDATE = {
+    "nickname": A1K,
+    "first_name": B1K,
+    "last_name": C1K,
+    "primary_condition": D1K,
+    "language": "en-US",
+    "country": "US",
+    "timezone": "America/New_York"
+}
+
+
+def _put(client, payload, headers=_AUTH_HEADERS):
+    """PUT a profile update with a JSON body."""
+    return client.put("/auth/profile", json=payload, headers=headers)
+
+
+def _put_ok(client, payload, headers=_AUTH_HEADERS):
+    """PUT a profile update, assert it succeeded and return the user object."""
+    response = _put(client, payload, headers)
+    assert response.status_code == 200
+    return _user(response)
+
+
+def _user(response):
+    """Decode a profile response body and return its user object."""
+    return loads(response.content)["user"]
+
+
+def _assert_updated_at(user_data, now):
+    """Assert updated_at is an ISO timestamp equal to the frozen clock."""
+    updated_at = user_data["updated_at"]
+    assert isinstance(updated_at, str)
+    assert datetime.fromisoformat(updated_at.replace('Z', '+00:00')) == now
+
+
+def test_profile_update_success(auth_client, frozen_now):
+    """Test successful profile update."""
+    response = _put(auth_client, _SAMPLE_PROFILE_UPDATE)
     
-    @pytest.fixture
-    def client(self):
-        """Create a test client for the FastAPI app."""
-        from app_auth_simple import app
-        return TestClient(app)
+    assert response.status_code == 200
+    data = response.json()
     
-    @pytest.fixture
-    def sample_user_data(self):
-        """Sample user data for testing."""
-        return {
-            "id": 1,
-            "email": "test@example.com",
-            "nickname": "TestUser",
-            "first_name": "Test",
-            "last_name": "User",
-            "primary_condition": "Test Condition",
-            "language": "ja-JP",
-            "country": "JP",
-            "timezone": "Asia/Tokyo",
-            "created_at": "2024-01-01T00:00:00Z"
-        }
+    assert "message" in data
+    assert data["message"] == "Profile updated successfully"
+    assert "user" in data
     
-    @pytest.fixture
-    def sample_profile_update_data(self):
-        """Sample profile update data for testing."""
-        return {
-            "nickname": "UpdatedNickname",
-            "first_name": "UpdatedFirst",
-            "last_name": "UpdatedLast",
-            "primary_condition": "Updated Condition",
-            "language": "en-US",
-            "country": "US",
-            "timezone": "America/New_York"
-        }
+    user_data = data["user"]
+    assert user_data["nickname"] == "UpdatedNickname"
+    assert user_data["first_name"] == "UpdatedFirst"
+    assert user_data["last_name"] == "UpdatedLast"
+    assert user_data["primary_condition"] == "Updated Condition"
+    assert user_data["language"] == "en-US"
+    assert user_data["country"] == "US"
+    assert user_data["timezone"] == "America/New_York"
+    _assert_updated_at(user_data, frozen_now)
+
+
+def test_profile_update_partial(auth_client):
+    """Test partial profile update."""
+    user_data = _put_ok(auth_client, _PARTIAL_PROFILE_UPDATE)
+    # Updated fields
+    assert user_data["nickname"] == "PartialUpdate"
+    assert user_data["language"] == "fr-FR"
     
-    @pytest.fixture
-    def partial_profile_update_data(self):
-        """Partial profile update data for testing."""
-        return {
-            "nickname": "PartialUpdate",
-            "language": "fr-FR"
-        }
+    # Unchanged fields should remain default
+    assert user_data["first_name"] == "Test"
+    assert user_data["last_name"] == "User"
+    assert user_data["primary_condition"] == "Test Condition"
+    assert user_data["country"] == "US"
+    assert user_data["timezone"] == "UTC"
+
+
+def test_profile_update_no_authorization(auth_client):
+    """Test profile update without authorization header."""
+    response = auth_client.put(
+        "/auth/profile",
+        json=_SAMPLE_PROFILE_UPDATE
+    )
+    
+    assert response.status_code == 400
+    data = response.json()
+    assert "detail" in data
+
+
+def test_profile_update_invalid_authorization(auth_client):
+    """Test profile update with invalid authorization header."""
+    response = auth_client.put(
+        "/auth/profile",
+        json=_SAMPLE_PROFILE_UPDATE,
+        headers={"Authorization": "Invalid token"}
+    )
+    
+    assert response.status_code == 400
+    data = response.json()
+    assert "detail" in data
+
+
+def test_profile_update_empty_data(auth_client):
+    """Test profile update with empty data."""
+    # Should return original user data without changes
+    user_data = _put_ok(auth_client, {})
+    assert user_data["nickname"] == "User"
+    assert user_data["first_name"] == "Test"
+    assert user_data["last_name"] == "User"
+
+
+def test_profile_update_none_values(auth_client):
+    """Test profile update with None values."""
+    update_data = {
+        "nickname": None,
+        "first_name": None,
+        "language": "en-US"
+    }
+    
+    user_data = _put_ok(auth_client, update_data)
+    # None values should not be updated
+    assert user_data["nickname"] == "User"  # Original value
+    assert user_data["first_name"] == "Test"  # Original value
+    assert user_data["language"] == "en-US"  # Updated value
+
+
+def test_profile_update_malformed_json(auth_client):
+    """Test profile update with malformed JSON."""
+    response = auth_client.put(
+        "/auth/profile",
+        data="invalid json",
+        headers=_JSON_AUTH_HEADERS
+    )
     
-    @pytest.fixture
-    def invalid_profile_update_data(self):
-        """Invalid profile update data for testing."""
-        return {
-            "email": "new@example.com",  # Email should not be updatable
-            "invalid_field": "invalid_value"
-        }
-
-    def test_profile_update_success(self, client, sample_profile_update_data):
-        """Test successful profile update."""
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json=sample_profile_update_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            assert "message" in data
-            assert data["message"] == "Profile updated successfully"
-            assert "user" in data
-            
-            user_data = data["user"]
-            assert user_data["nickname"] == "UpdatedNickname"
-            assert user_data["first_name"] == "UpdatedFirst"
-            assert user_data["last_name"] == "UpdatedLast"
-            assert user_data["primary_condition"] == "Updated Condition"
-            assert user_data["language"] == "en-US"
-            assert user_data["country"] == "US"
-            assert user_data["timezone"] == "America/New_York"
-            assert "updated_at" in user_data
-
-    def test_profile_update_partial(self, client, partial_profile_update_data):
-        """Test partial profile update."""
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json=partial_profile_update_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            user_data = data["user"]
-            # Updated fields
-            assert user_data["nickname"] == "PartialUpdate"
-            assert user_data["language"] == "fr-FR"
-            
-            # Unchanged fields should remain default
-            assert user_data["first_name"] == "Test"
-            assert user_data["last_name"] == "User"
-            assert user_data["primary_condition"] == "Test Condition"
-            assert user_data["country"] == "US"
-            assert user_data["timezone"] == "UTC"
-
-    def test_profile_update_no_authorization(self, client, sample_profile_update_data):
-        """Test profile update without authorization header."""
-        response = client.put(
-            "/auth/profile",
-            json=sample_profile_update_data
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "detail" in data
-
-    def test_profile_update_invalid_authorization(self, client, sample_profile_update_data):
-        """Test profile update with invalid authorization header."""
-        response = client.put(
-            "/auth/profile",
-            json=sample_profile_update_data,
-            headers={"Authorization": "Invalid token"}
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "detail" in data
-
-    def test_profile_update_empty_data(self, client):
-        """Test profile update with empty data."""
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json={},
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            # Should return original user data without changes
-            user_data = data["user"]
-            assert user_data["nickname"] == "User"
-            assert user_data["first_name"] == "Test"
-            assert user_data["last_name"] == "User"
-
-    def test_profile_update_none_values(self, client):
-        """Test profile update with None values."""
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            update_data = {
-                "nickname": None,
-                "first_name": None,
-                "language": "en-US"
-            }
-            
-            response = client.put(
-                "/auth/profile",
-                json=update_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            user_data = data["user"]
-            # None values should not be updated
-            assert user_data["nickname"] == "User"  # Original value
-            assert user_data["first_name"] == "Test"  # Original value
-            assert user_data["language"] == "en-US"  # Updated value
-
-    def test_profile_update_malformed_json(self, client):
-        """Test profile update with malformed JSON."""
-        response = client.put(
-            "/auth/profile",
-            data="invalid json",
-            headers={
-                "Authorization": "Bearer test-token",
-                "Content-Type": "application/json"
-            }
-        )
-        
-        assert response.status_code == 422
-
-    def test_profile_update_large_data(self, client):
-        """Test profile update with large data."""
-        large_data = {
-            "nickname": "A" * 1000,  # Very long nickname
-            "first_name": "B" * 1000,  # Very long first name
-            "last_name": "C" * 1000,  # Very long last name
-            "primary_condition": "D" * 1000,  # Very long condition
-            "language": "en-US",
-            "country": "US",
-            "timezone": "America/New_York"
-        }
-        
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json=large_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            user_data = data["user"]
-            assert user_data["nickname"] == "A" * 1000
-            assert user_data["first_name"] == "B" * 1000
-            assert user_data["last_name"] == "C" * 1000
-            assert user_data["primary_condition"] == "D" * 1000
-
-    def test_profile_update_special_characters(self, client):
-        """Test profile update with special characters."""
-        special_data = {
-            "nickname": "テストユーザー",
-            "first_name": "José",
-            "last_name": "García-López",
-            "primary_condition": "心不全 & 糖尿病",
-            "language": "ja-JP",
-            "country": "JP",
-            "timezone": "Asia/Tokyo"
-        }
-        
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json=special_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            user_data = data["user"]
-            assert user_data["nickname"] == "テストユーザー"
-            assert user_data["first_name"] == "José"
-            assert user_data["last_name"] == "García-López"
-            assert user_data["primary_condition"] == "心不全 & 糖尿病"
-
-    def test_profile_update_timezone_validation(self, client):
-        """Test profile update with different timezone values."""
-        timezone_data = {
-            "timezone": "Europe/London"
-        }
-        
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json=timezone_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            user_data = data["user"]
-            assert user_data["timezone"] == "Europe/London"
-
-    def test_profile_update_language_validation(self, client):
-        """Test profile update with different language values."""
-        language_data = {
-            "language": "fr-FR"
-        }
-        
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json=language_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            user_data = data["user"]
-            assert user_data["language"] == "fr-FR"
-
-    def test_profile_update_country_validation(self, client):
-        """Test profile update with different country values."""
-        country_data = {
-            "country": "FR"
-        }
-        
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json=country_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            user_data = data["user"]
-            assert user_data["country"] == "FR"
-
-    def test_profile_update_response_structure(self, client, sample_profile_update_data):
-        """Test that profile update response has correct structure."""
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json=sample_profile_update_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            # Check response structure
-            assert isinstance(data, dict)
-            assert "message" in data
-            assert "user" in data
-            
-            # Check message
-            assert isinstance(data["message"], str)
-            assert data["message"] == "Profile updated successfully"
-            
-            # Check user data structure
-            user_data = data["user"]
-            required_fields = [
-                "id", "email", "nickname", "first_name", "last_name",
-                "primary_condition", "language", "country", "timezone",
-                "created_at", "updated_at"
-            ]
-            
-            for field in required_fields:
-                assert field in user_data, f"Missing field: {field}"
-            
-            # Check data types
-            assert isinstance(user_data["id"], int)
-            assert isinstance(user_data["email"], str)
-            assert isinstance(user_data["nickname"], str)
-            assert isinstance(user_data["first_name"], str)
-            assert isinstance(user_data["last_name"], str)
-            assert isinstance(user_data["primary_condition"], str)
-            assert isinstance(user_data["language"], str)
-            assert isinstance(user_data["country"], str)
-            assert isinstance(user_data["timezone"], str)
-            assert isinstance(user_data["created_at"], str)
-            assert isinstance(user_data["updated_at"], str)
-
-    def test_profile_update_updated_at_timestamp(self, client, sample_profile_update_data):
-        """Test that updated_at timestamp is correctly set."""
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            fixed_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.now.return_value = fixed_time
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            response = client.put(
-                "/auth/profile",
-                json=sample_profile_update_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            user_data = data["user"]
-            updated_at = user_data["updated_at"]
-            
-            # Check that updated_at is a valid ISO format timestamp
-            assert isinstance(updated_at, str)
-            # Should be able to parse as ISO format
-            parsed_time = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-            assert parsed_time == fixed_time
-
-    def test_profile_update_concurrent_updates(self, client):
-        """Test handling of concurrent profile updates."""
-        update_data_1 = {"nickname": "User1"}
-        update_data_2 = {"nickname": "User2"}
-        
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            # Simulate concurrent updates
-            response1 = client.put(
-                "/auth/profile",
-                json=update_data_1,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            response2 = client.put(
-                "/auth/profile",
-                json=update_data_2,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            # Both should succeed
-            assert response1.status_code == 200
-            assert response2.status_code == 200
-            
-            # Check that the last update is reflected
-            data1 = response1.json()
-            data2 = response2.json()
-            
-            assert data1["user"]["nickname"] == "User1"
-            assert data2["user"]["nickname"] == "User2"
-
-
-class TestProfileManagementIntegration:
-    """Integration tests for profile management with other components."""
+    assert response.status_code == 422
+
+
+def test_profile_update_large_data(auth_client):
+    """Test profile update with large data."""
+    user_data = _put_ok(auth_client, _LARGE_PROFILE_UPDATE)
+    assert user_data["nickname"] == A1K
+    assert user_data["first_name"] == B1K
+    assert user_data["last_name"] == C1K
+    assert user_data["primary_condition"] == D1K
+
+
+def test_profile_update_special_characters(auth_client):
+    """Test profile update with special characters."""
+    special_data = {
+        "nickname": "テストユーザー",
+        "first_name": "José",
+        "last_name": "García-López",
+        "primary_condition": "心不全 & 糖尿病",
+        "language": "ja-JP",
+        "country": "JP",
+        "timezone": "Asia/Tokyo"
+    }
     
-    @pytest.fixture
-    def client(self):
-        """Create a test client for the FastAPI app."""
-        from app_auth_simple import app
-        return TestClient(app)
+    user_data = _put_ok(auth_client, special_data)
+    assert user_data["nickname"] == "テストユーザー"
+    assert user_data["first_name"] == "José"
+    assert user_data["last_name"] == "García-López"
+    assert user_data["primary_condition"] == "心不全 & 糖尿病"
+
+
+@pytest.mark.parametrize("field,value", [
+    ("timezone", "Europe/London"),
+    ("language", "fr-FR"),
+    ("country", "FR"),
+    ("nickname", "PartialUpdate"),
+])
+def test_profile_update_single_field(auth_client, field, value):
+    """Test profile update of a single field."""
+    assert _put_ok(auth_client, {field: value})[field] == value
+
+
+def test_profile_update_response_structure(auth_client):
+    """Test that profile update response has correct structure."""
+    response = _put(auth_client, _SAMPLE_PROFILE_UPDATE)
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    # Check response structure
+    assert isinstance(data, dict)
+    assert "message" in data
+    assert "user" in data
+    
+    # Check message
+    assert isinstance(data["message"], str)
+    assert data["message"] == "Profile updated successfully"
+    
+    # Check user data structure
+    user_data = data["user"]
+    for field, field_type in _USER_SCHEMA:
+        assert field in user_data, f"Missing field: {field}"
+        assert isinstance(user_data[field], field_type), field
+
+
+def test_profile_update_updated_at_timestamp(auth_client, frozen_now):
+    """Test that updated_at timestamp is correctly set."""
+    _assert_updated_at(_put_ok(auth_client, _SAMPLE_PROFILE_UPDATE), frozen_now)
+
+
+def test_profile_update_concurrent_updates(auth_client):
+    """Test handling of concurrent profile updates."""
+    update_data_1 = {"nickname": "User1"}
+    update_data_2 = {"nickname": "User2"}
+    
+    # Simulate concurrent updates
+    response1 = _put(auth_client, update_data_1)
+    
+    response2 = _put(auth_client, update_data_2)
+    
+    # Both should succeed
+    assert response1.status_code == 200
+    assert response2.status_code == 200
+    
+    # Check that the last update is reflected
+    assert _user(response1)["nickname"] == "User1"
+    assert _user(response2)["nickname"] == "User2"
+
+
+# Integration with registration and login
+
+def test_profile_update_after_registration(auth_client, registered_token):
+    """Test profile update after user registration."""
+    access_token = registered_token
+    
+    # Update profile with the token
+    profile_update_data = {
+        "nickname": "UpdatedNewUser",
+        "language": "ja-JP",
+        "country": "JP"
+    }
+    
+    user_data = _put_ok(
+        auth_client,
+        profile_update_data,
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+    assert user_data["nickname"] == "UpdatedNewUser"
+    assert user_data["language"] == "ja-JP"
+    assert user_data["country"] == "JP"
+
+
+def test_profile_update_with_login_flow(auth_client, login_token):
+    """Test profile update in a complete login flow."""
+    access_token = login_token
+    
+    # Update profile
+    profile_update_data = {
+        "nickname": "UpdatedLoginUser",
+        "primary_condition": "Updated Condition"
+    }
+    
+    user_data = _put_ok(
+        auth_client,
+        profile_update_data,
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+    assert user_data["nickname"] == "UpdatedLoginUser"
+    assert user_data["primary_condition"] == "Updated Condition"
+
+
+def test_profile_update_error_handling(auth_client):
+    """Test error handling in profile update."""
+    # Test with invalid JSON
+    response = auth_client.put(
+        "/auth/profile",
+        data="invalid json",
+        headers=_JSON_AUTH_HEADERS
+    )
+    
+    assert response.status_code == 422
+    
+    # Test with missing Content-Type
+    response = _put(auth_client, {"nickname": "Test"})
+    
+    # Should still work as FastAPI can handle JSON without explicit Content-Type
+    assert response.status_code == 200
+
+
+def test_profile_update_performance(auth_client):
+    """Test profile update with all fields set."""
+    large_update_data = {
+        "nickname": "PerformanceTest",
+        "first_name": "Performance",
+        "last_name": "Test",
+        "primary_condition": "Performance Testing",
+        "language": "en-US",
+        "country": "US",
+        "timezone": "America/New_York"
+    }
     
-    def test_profile_update_after_registration(self, client):
-        """Test profile update after user registration."""
-        # First register a user
-        registration_data = {
-            "email": "newuser@example.com",
-            "password": "password123",
-            "nickname": "NewUser",
-            "first_name": "New",
-            "last_name": "User",
-            "primary_condition": "Test Condition",
-            "language": "en-US",
-            "country": "US",
-            "timezone": "UTC"
-        }
-        
-        reg_response = client.post("/auth/register", json=registration_data)
-        assert reg_response.status_code == 200
-        
-        # Extract token from registration response
-        reg_data = reg_response.json()
-        access_token = reg_data["access_token"]
-        
-        # Update profile with the token
-        profile_update_data = {
-            "nickname": "UpdatedNewUser",
-            "language": "ja-JP",
-            "country": "JP"
-        }
-        
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            update_response = client.put(
-                "/auth/profile",
-                json=profile_update_data,
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            
-            assert update_response.status_code == 200
-            update_data = update_response.json()
-            
-            user_data = update_data["user"]
-            assert user_data["nickname"] == "UpdatedNewUser"
-            assert user_data["language"] == "ja-JP"
-            assert user_data["country"] == "JP"
-
-    def test_profile_update_with_login_flow(self, client):
-        """Test profile update in a complete login flow."""
-        # Register user
-        registration_data = {
-            "email": "loginuser@example.com",
-            "password": "password123",
-            "nickname": "LoginUser",
-            "first_name": "Login",
-            "last_name": "User",
-            "primary_condition": "Test Condition",
-            "language": "en-US",
-            "country": "US",
-            "timezone": "UTC"
-        }
-        
-        reg_response = client.post("/auth/register", json=registration_data)
-        assert reg_response.status_code == 200
-        
-        # Login user
-        login_data = {
-            "email": "loginuser@example.com",
-            "password": "password123",
-            "remember_me": False
-        }
-        
-        login_response = client.post("/auth/login", json=login_data)
-        assert login_response.status_code == 200
-        
-        login_data_response = login_response.json()
-        access_token = login_data_response["access_token"]
-        
-        # Update profile
-        profile_update_data = {
-            "nickname": "UpdatedLoginUser",
-            "primary_condition": "Updated Condition"
-        }
-        
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            update_response = client.put(
-                "/auth/profile",
-                json=profile_update_data,
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            
-            assert update_response.status_code == 200
-            update_data = update_response.json()
-            
-            user_data = update_data["user"]
-            assert user_data["nickname"] == "UpdatedLoginUser"
-            assert user_data["primary_condition"] == "Updated Condition"
-
-    def test_profile_update_error_handling(self, client):
-        """Test error handling in profile update."""
-        # Test with invalid JSON
-        response = client.put(
-            "/auth/profile",
-            data="invalid json",
-            headers={
-                "Authorization": "Bearer test-token",
-                "Content-Type": "application/json"
-            }
-        )
-        
-        assert response.status_code == 422
-        
-        # Test with missing Content-Type
-        response = client.put(
-            "/auth/profile",
-            json={"nickname": "Test"},
-            headers={"Authorization": "Bearer test-token"}
-        )
-        
-        # Should still work as FastAPI can handle JSON without explicit Content-Type
-        assert response.status_code == 200
-
-    def test_profile_update_performance(self, client):
-        """Test profile update performance with multiple fields."""
-        large_update_data = {
-            "nickname": "PerformanceTest",
-            "first_name": "Performance",
-            "last_name": "Test",
-            "primary_condition": "Performance Testing",
-            "language": "en-US",
-            "country": "US",
-            "timezone": "America/New_York"
-        }
-        
-        with patch('app_auth_simple.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-            
-            import time
-            start_time = time.time()
-            
-            response = client.put(
-                "/auth/profile",
-                json=large_update_data,
-                headers={"Authorization": "Bearer test-token"}
-            )
-            
-            end_time = time.time()
-            response_time = end_time - start_time
-            
-            assert response.status_code == 200
-            # Should complete within reasonable time (less than 1 second)
-            assert response_time < 1.0
-            
-            data = response.json()
-            user_data = data["user"]
-            assert user_data["nickname"] == "PerformanceTest"
-            assert user_data["first_name"] == "Performance"
-            assert user_data["last_name"] == "Test"
+    user_data = _put_ok(auth_client, large_update_data)
+    assert user_data["nickname"] == "PerformanceTest"
+    assert user_data["first_name"] == "Performance"
+    assert user_data["last_name"] == "Test"